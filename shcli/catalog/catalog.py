@@ -1,5 +1,5 @@
 import requests
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import logging
 
 from shcli.utils.utils import validate_bbox
@@ -15,7 +15,9 @@ def catalog_request(
     bbox: List[float],
     limit: int = 10,
     cloud_cover: int = 20,
-    url: str = "https://services.sentinel-hub.com/api/v1/catalog/1.0.0/search"
+    url: str = "https://services.sentinel-hub.com/api/v1/catalog/1.0.0/search",
+    next_token: Optional[int] = None,
+    raise_on_error: bool = False
 ) -> Dict[str, Any]:
     """
     Sends a request to the Sentinel Hub Catalog API.
@@ -28,6 +30,8 @@ def catalog_request(
         limit (int): Maximum number of results to return (default: 10).
         cloud_cover (int): Maximum cloud cover percentage (default: 20).
         url (str): The API endpoint URL (default: Sentinel Hub Catalog API endpoint).
+        next_token (int): Value of context.next from a previous response, to fetch the next page.
+        raise_on_error (bool): Re-raise request errors instead of returning an empty result.
 
     Returns:
         Dict[str, Any]: The API response as a dictionary.
@@ -58,6 +62,9 @@ def catalog_request(
         "filter-lang": "cql2-json"
     }
 
+    if next_token is not None:
+        data["next"] = next_token
+
     try:
         logging.info("Sending request to Sentinel Hub Catalog API.")
         response = requests.post(url, headers=headers, json=data)
@@ -66,6 +73,8 @@ def catalog_request(
         return response.json()  
     except requests.RequestException as e:
         print("Error making the catalog request:", e)
+        if raise_on_error:
+            raise
         return {}
 
 
@@ -1,3 +1,4 @@
+from datetime import date
 from typing import List, Optional
 import click
 import json
@@ -7,8 +8,12 @@ import logging
 from shcli.auth.login_model import LoginModel
 from shcli.auth.user_auth import LoginAuth
 from shcli.catalog.catalog import catalog_request, extract_statistics
+from shcli.process.budget import BudgetScheduler, estimate_processing_units
 from shcli.process.process import process_request
-from shcli.process.query_builder import create_request_data
+from shcli.process.query_builder import MAX_OUTPUT_PIXELS, create_request_data
+from shcli.sync.sync import load_aois, sync_aois
+from shcli.sync.sync_model import SyncOptions
+from shcli.utils.file_utils import COG_COMPRESSIONS, FILE_EXTENSIONS, cog_writer, save_image_to_file
 from shcli.utils.utils import read_login_credentials, save_login_credentials, validate_bbox
 
 
@@ -38,9 +43,15 @@ def show_examples():
         
         - VISUAL 
         shcli getimages --bbox 12.845434 47.753636 13.099575 47.882276 --start-date 2022-10-01 --end-date 2024-10-31 --satellite-type sentinel-2-l2a --output-type VISUAL --output-format PNG --output-file VISUAL_image
+
+        - VISUAL at 10 m per pixel
+        shcli getimages --bbox 12.845434 47.753636 13.099575 47.882276 --start-date 2022-10-01 --end-date 2024-10-31 --satellite-type sentinel-2-l2a --output-type VISUAL --output-format PNG --output-file VISUAL_image --resolution 10
    
      3. Generate Catalog Statistics:
        shcli catalog-s --bbox 12.845434 47.753636 13.099575 47.882276 --start-date 2022-10-01 --end-date 2024-10-31
+
+     4. Sync new acquisitions for a list of AOIs:
+       shcli sync --aoi-file aois.json --start-date 2024-10-01 --satellite-type sentinel-2-l2a --output-type VISUAL --workers 4
     """
     click.echo(examples)
 
@@ -72,8 +83,12 @@ def auth(client_id: str, client_secret: str):
 @click.option("--end-date", required=True, help="End date in YYYY-MM-DD format.")
 @click.option("--satellite-type", required=True, type=click.Choice(["sentinel-2-l2a", "sentinel-2-l1c"]), help="Satellite type.")
 @click.option("--output-type", default="NDVI", type=click.Choice(["NDVI", "VISUAL"]), help="type for image output. eg. NDVI or VISUAL")
-@click.option("--output-format", default="PNG", type=click.Choice(["PNG", "TIFF"]), help="Output image format eg PNG or TIFF.")
+@click.option("--output-format", default="PNG", type=click.Choice(["PNG", "TIFF", "COG"]), help="Output image format eg PNG, TIFF or COG (Cloud-Optimized GeoTIFF).")
 @click.option("--output-file", default="output_image.png", help="Output file name for the downloaded image.")
+@click.option("--resolution", type=click.FloatRange(min=0, min_open=True), default=None, help="Output resolution in meters per pixel, e.g. 10. Sizes the image from the bbox extent.")
+@click.option("--max-pixels", type=click.IntRange(min=1, max=MAX_OUTPUT_PIXELS), default=MAX_OUTPUT_PIXELS, show_default=True, help="Maximum output width or height in pixels, the aspect ratio is kept.")
+@click.option("--compression", default="DEFLATE", type=click.Choice(COG_COMPRESSIONS), help="Internal compression for COG output.")
+@click.option("--dry-run", is_flag=True, default=False, help="Report the estimated processing units without submitting the request.")
 def getimages(
     bbox: List[float], 
     start_date: str, 
@@ -81,24 +96,23 @@ def getimages(
     satellite_type: str, 
     output_type: str, 
     output_format: str, 
-    output_file: Optional[str] = None
+    output_file: Optional[str] = None,
+    resolution: Optional[float] = None,
+    max_pixels: int = MAX_OUTPUT_PIXELS,
+    compression: str = "DEFLATE",
+    dry_run: bool = False
     ):
     
     """
         Fetch and save images from Sentinel Hub.
     """
     try:
-        logger.info("Fetching login credentials...")
-        login_credentials = read_login_credentials()
-        token = LoginAuth(login_credentials).get_token()["access_token"]
-
         if not validate_bbox(bbox):
             raise ValueError("Invalid bounding box provided.")
 
         logger.info("Creating request data...")
 
-        file_extensions_mapping = {"PNG": ".png", "TIFF": ".tiff"}
-        file_extension = file_extensions_mapping.get(output_format.upper(), ".png")
+        file_extension = FILE_EXTENSIONS.get(output_format.upper(), ".png")
 
         if not output_file.endswith(file_extension):
             output_file += file_extension
@@ -111,12 +125,27 @@ def getimages(
             mosaickingOrder="leastCC",
             satellite_type=satellite_type,
             eval_type=output_type,
-            output_format=output_format
+            output_format=output_format,
+            resolution=resolution,
+            max_pixels=max_pixels
         )
 
+        if dry_run:
+            processing_units = estimate_processing_units(request_data)
+            click.echo(f"Estimated processing units: {processing_units:.2f} (1 request, {request_data['output']['width']}x{request_data['output']['height']} pixels)")
+            return
+
+        writer = cog_writer(bbox, compression) if output_format.upper() == "COG" else save_image_to_file
+
+        logger.info("Fetching login credentials...")
+        login_credentials = read_login_credentials()
+        token = LoginAuth(login_credentials).get_token()["access_token"]
+
         logger.info("Processing request to fetch the image...")
-        process_request(token=token, data=request_data, output_file=output_file)
-        click.echo(f"Image saved as {output_file}")
+        if process_request(token=token, data=request_data, output_file=output_file, writer=writer):
+            click.echo(f"Image saved as {output_file}")
+        else:
+            click.echo("Error fetching image, see the log for details.", err=True)
 
     except Exception as e:
         logger.error(f"Error fetching image: {e}")
@@ -165,6 +194,81 @@ def catalog_s(bbox: List[float], start_date: str, end_date: str):
         click.echo(f"Error generating statistics: {e}", err=True)
 
 
+@cli.command()
+@click.option("--aoi-file", required=True, help="JSON file with a list of AOIs, eg [{\"name\": \"salzburg\", \"bbox\": [minLon, minLat, maxLon, maxLat]}].")
+@click.option("--start-date", required=True, help="Start date in YYYY-MM-DD format, used for AOIs without a recorded state.")
+@click.option("--end-date", default=None, help="End date in YYYY-MM-DD format (default: today).")
+@click.option("--satellite-type", required=True, type=click.Choice(["sentinel-2-l2a", "sentinel-2-l1c"]), help="Satellite type.")
+@click.option("--output-type", default="NDVI", type=click.Choice(["NDVI", "VISUAL"]), help="type for image output. eg. NDVI or VISUAL")
+@click.option("--output-format", default="PNG", type=click.Choice(["PNG", "TIFF", "COG"]), help="Output image format eg PNG, TIFF or COG (Cloud-Optimized GeoTIFF).")
+@click.option("--output-dir", default="shcli_sync", show_default=True, help="Directory for the downloaded images.")
+@click.option("--state-dir", default=".shcli_state", show_default=True, help="Directory for the per-AOI state files.")
+@click.option("--max-cloud-coverage", default=20, type=click.IntRange(min=0, max=100), show_default=True, help="Maximum cloud cover percentage.")
+@click.option("--resolution", type=click.FloatRange(min=0, min_open=True), default=None, help="Output resolution in meters per pixel, e.g. 10. Sizes the image from the bbox extent.")
+@click.option("--max-pixels", type=click.IntRange(min=1, max=MAX_OUTPUT_PIXELS), default=MAX_OUTPUT_PIXELS, show_default=True, help="Maximum output width or height in pixels, the aspect ratio is kept.")
+@click.option("--compression", default="DEFLATE", type=click.Choice(COG_COMPRESSIONS), help="Internal compression for COG output.")
+@click.option("--workers", default=1, type=click.IntRange(min=1), show_default=True, help="Number of AOIs synced in parallel.")
+@click.option("--pu-per-minute", type=click.FloatRange(min=0, min_open=True), default=None, help="Processing unit budget per minute shared by all workers.")
+@click.option("--requests-per-minute", type=click.FloatRange(min=0, min_open=True), default=None, help="Request budget per minute shared by all workers, covering Catalog and Process API calls.")
+@click.option("--dry-run", is_flag=True, default=False, help="Report new acquisitions and estimated processing units without fetching images.")
+def sync(
+    aoi_file: str,
+    start_date: str,
+    end_date: Optional[str],
+    satellite_type: str,
+    output_type: str,
+    output_format: str,
+    output_dir: str,
+    state_dir: str,
+    max_cloud_coverage: int,
+    resolution: Optional[float],
+    max_pixels: int,
+    compression: str,
+    workers: int,
+    pu_per_minute: Optional[float],
+    requests_per_minute: Optional[float],
+    dry_run: bool
+    ):
+
+    """
+        Fetch only the acquisitions that are new since the last run for each AOI.
+    """
+    try:
+        aois = load_aois(aoi_file)
+
+        options = SyncOptions(
+            start_date=start_date,
+            end_date=end_date or date.today().isoformat(),
+            satellite_type=satellite_type,
+            output_type=output_type,
+            output_format=output_format,
+            output_dir=output_dir,
+            state_dir=state_dir,
+            max_cloud_coverage=max_cloud_coverage,
+            resolution=resolution,
+            max_pixels=max_pixels,
+            compression=compression,
+            dry_run=dry_run
+        )
+        scheduler = BudgetScheduler(pu_per_minute=pu_per_minute, requests_per_minute=requests_per_minute)
+
+        logger.info("Fetching login credentials...")
+        login_credentials = read_login_credentials()
+        token = LoginAuth(login_credentials).get_token()["access_token"]
+
+        logger.info(f"Syncing {len(aois)} AOIs...")
+        summaries = sync_aois(token=token, aois=aois, options=options, workers=workers, scheduler=scheduler)
+
+        click.echo("Sync Results:")
+        click.echo(json.dumps(summaries, indent=4))
+
+        if dry_run:
+            total = sum(summary.get("estimated_processing_units", 0) for summary in summaries)
+            click.echo(f"Estimated processing units: {total:.2f}")
+
+    except Exception as e:
+        logger.error(f"Error syncing AOIs: {e}")
+        click.echo(f"Error syncing AOIs: {e}", err=True)
 
 
 if __name__ == "__main__":
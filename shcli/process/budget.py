@@ -0,0 +1,137 @@
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+import logging
+
+
+
+logger = logging.getLogger(__name__)
+
+# Processing unit rules of the Sentinel Hub Process API: a 512x512 output with
+# 3 input bands and an 8-bit (or 16-bit) sample type costs 1 PU.
+PU_REFERENCE_PIXELS = 512 * 512
+PU_REFERENCE_BANDS = 3
+PU_MINIMUM_AREA_FACTOR = 0.01
+# Slack for float rounding when comparing refilled tokens against a request.
+TOKEN_EPSILON = 1e-9
+SAMPLE_TYPE_FACTORS = {
+    "FLOAT32": 2.0
+}
+
+_BAND_PATTERN = re.compile(r"[\"'](B\d{2}|B8A)[\"']")
+_SAMPLE_TYPE_PATTERN = re.compile(r"sampleType\s*:\s*[\"'](\w+)[\"']")
+
+
+def estimate_processing_units(data: Dict[str, Any], num_dates: int = 1) -> float:
+    """
+    Estimates the processing units charged for a Process API request payload.
+
+    Args:
+        data (dict): Request payload as built by create_request_data.
+        num_dates (int): Number of acquisitions read per pixel (1 for SIMPLE mosaicking).
+
+    Returns:
+        float: The estimated processing units.
+    """
+    if not data:
+        return 0.0
+
+    output = data.get("output", {})
+    evalscript = data.get("evalscript", "")
+
+    pixels = float(output.get("width", 0)) * float(output.get("height", 0))
+    area_factor = max(PU_MINIMUM_AREA_FACTOR, pixels / PU_REFERENCE_PIXELS)
+
+    bands = len(set(_BAND_PATTERN.findall(evalscript))) or PU_REFERENCE_BANDS
+    band_factor = bands / PU_REFERENCE_BANDS
+
+    sample_types = _SAMPLE_TYPE_PATTERN.findall(evalscript)
+    sample_factor = max((SAMPLE_TYPE_FACTORS.get(s.upper(), 1.0) for s in sample_types), default=1.0)
+
+    return area_factor * band_factor * sample_factor * max(1, num_dates)
+
+
+def estimate_batch_processing_units(payloads: Iterable[Dict[str, Any]], num_dates: int = 1) -> float:
+    """
+    Estimates the total processing units for several request payloads.
+    """
+    return sum(estimate_processing_units(data, num_dates) for data in payloads)
+
+
+class TokenBucket:
+    """ A thread-safe token bucket refilled at a fixed rate per minute """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        if rate_per_minute <= 0:
+            raise ValueError("Rate per minute must be positive.")
+
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Blocks until the requested amount of tokens is available and takes it.
+
+        Requests larger than the capacity wait for a full bucket and leave it
+        negative, so the next caller waits off the overrun.
+
+        Returns:
+            float: The time in seconds spent waiting.
+        """
+        required = min(amount, self.capacity)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= required - TOKEN_EPSILON:
+                    self.tokens -= amount
+                    return waited
+                delay = (required - self.tokens) / self.rate_per_second
+
+            self._sleep(delay)
+            waited += delay
+
+
+class BudgetScheduler:
+    """ Paces requests to a processing unit and request budget per minute """
+
+    def __init__(
+        self,
+        pu_per_minute: Optional[float] = None,
+        requests_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.pu_bucket = TokenBucket(pu_per_minute, clock=clock, sleep=sleep) if pu_per_minute else None
+        self.request_bucket = TokenBucket(requests_per_minute, clock=clock, sleep=sleep) if requests_per_minute else None
+
+    def acquire(self, processing_units: float) -> None:
+        """
+        Blocks until one request costing processing_units fits in the budget.
+        """
+        waited = 0.0
+        if self.request_bucket is not None:
+            waited += self.request_bucket.acquire(1.0)
+        if self.pu_bucket is not None:
+            waited += self.pu_bucket.acquire(processing_units)
+
+        if waited > 0:
+            logger.info(f"Waited {waited:.1f}s to stay within the processing budget.")
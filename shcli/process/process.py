@@ -1,7 +1,8 @@
 import requests
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 import logging
 
+from shcli.process.budget import BudgetScheduler, estimate_processing_units
 from shcli.utils.file_utils import save_image_to_file
 
 
@@ -11,8 +12,10 @@ def process_request(
     token: str,
     data: Dict[str, Any],
     url: str = "https://services.sentinel-hub.com/api/v1/process",
-    output_file: str = "output_image.jpg"
-) -> None:
+    output_file: str = "output_image.jpg",
+    scheduler: Optional[BudgetScheduler] = None,
+    writer: Callable[[bytes, str], bool] = save_image_to_file
+) -> bool:
     """
     Makes a Sentinel Hub Process API request and handles image responses.
 
@@ -21,22 +24,28 @@ def process_request(
         data (dict): The request payload for the Sentinel Hub Process API.
         url (str): The API endpoint URL (default: Sentinel Hub Process API endpoint).
         output_file (str): Filepath to save the returned image.
+        scheduler (BudgetScheduler): Optional scheduler pacing requests to a processing budget.
+        writer (callable): Function saving the response content to output_file and returning True on success (default: raw bytes).
 
     Returns:
-        None: The image is saved to the specified file.
+        bool: True if the request succeeded and the image was saved.
     """
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {token}"
     }
 
+    if scheduler is not None:
+        scheduler.acquire(estimate_processing_units(data))
+
     try:
         logger.info(f"Sending POST request to {url} with provided data.")
         response = requests.post(url, headers=headers, json=data)
         response.raise_for_status()  
         
         logger.info("Request successful. Saving the image to the specified file.")
-        save_image_to_file(response.content, output_file)
+        return writer(response.content, output_file)
 
     except requests.RequestException as e:
-        logger.error("Error making the API request:", e)
+        logger.error(f"Error making the API request: {e}")
+        return False
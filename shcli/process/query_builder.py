@@ -1,12 +1,15 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import logging
 
-from shcli.utils.utils import validate_bbox
+from shcli.utils.utils import bbox_size_meters, validate_bbox
 
 
 
 logger = logging.getLogger(__name__) 
 
+# Sentinel Hub Process API limit for output width and height.
+MAX_OUTPUT_PIXELS = 2500
+
 def get_evalscript(eval_type:str ="VISUAL")-> str:
     """
     Returns the appropriate evalscript based on the eval_type.
@@ -24,6 +27,7 @@ def get_evalscript(eval_type:str ="VISUAL")-> str:
         output: {
           id: "default",
           bands: 3,
+          sampleType: "AUTO"
         }
       }
     }
@@ -74,6 +78,44 @@ def get_evalscript(eval_type:str ="VISUAL")-> str:
     
     return ndvi_eval if eval_type.upper() == "NDVI" else visual_eval
 
+def compute_output_size(
+        bbox: list[float],
+        resolution: float,
+        max_pixels: int = MAX_OUTPUT_PIXELS
+        ) -> Tuple[int, int]:
+    """
+    Computes the output width and height in pixels for a target resolution.
+
+    If either side would exceed max_pixels, both sides are scaled down by the
+    same factor so the aspect ratio of the bounding box is kept.
+
+    Args:
+        bbox (list): Bounding box coordinates [minLon, minLat, maxLon, maxLat].
+        resolution (float): Target resolution in meters per pixel.
+        max_pixels (int): Maximum width or height in pixels (default: 2500).
+
+    Returns:
+        Tuple[int, int]: The (width, height) of the output in pixels.
+    """
+    if resolution <= 0:
+        raise ValueError("Resolution must be a positive number of meters per pixel.")
+
+    if max_pixels < 1:
+        raise ValueError("Maximum pixels must be at least 1.")
+
+    width_m, height_m = bbox_size_meters(bbox)
+    width = width_m / resolution
+    height = height_m / resolution
+
+    scale = max(width, height) / max_pixels
+    if scale > 1:
+        logger.info(f"Output size capped at {max_pixels} pixels, resolution reduced by a factor of {scale:.2f}.")
+        width /= scale
+        height /= scale
+
+    return max(1, min(max_pixels, round(width))), max(1, min(max_pixels, round(height)))
+
+
 def create_request_data(
         bbox: list[float], 
         start_date: str, 
@@ -84,14 +126,27 @@ def create_request_data(
         eval_type: str ="NDVI", 
         output_format="PNG",
         width: Optional[float] = 682.987,
-        height: Optional[float] = 514.207
+        height: Optional[float] = 514.207,
+        resolution: Optional[float] = None,
+        max_pixels: int = MAX_OUTPUT_PIXELS
         )-> Dict:
     """
     Creates the request data based on user inputs.
+
+    When resolution (meters per pixel) is given, width and height are derived
+    from the extent of the bounding box instead of the fixed defaults. Either
+    way, sides larger than max_pixels are scaled down keeping the aspect ratio.
     """
     if not validate_bbox(bbox):
         logger.error("Invalid bounding box provided. Aborting request.")
         return {}
+
+    if resolution is not None:
+        width, height = compute_output_size(bbox, resolution, max_pixels)
+    elif max(width, height) > max_pixels:
+        scale = max(width, height) / max_pixels
+        width = max(1, min(max_pixels, round(width / scale)))
+        height = max(1, min(max_pixels, round(height / scale)))
     
     start_date_iso = f"{start_date}T00:00:00Z"
     end_date_iso = f"{end_date}T23:59:59Z"
@@ -100,6 +155,7 @@ def create_request_data(
 
     format_mapping = {
         "TIFF": "image/tiff",
+        "COG": "image/tiff",
         "PNG": "image/png",
         "JPEG": "image/jpeg"
     }
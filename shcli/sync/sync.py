@@ -0,0 +1,220 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from shcli.catalog.catalog import catalog_request
+from shcli.process.budget import BudgetScheduler, estimate_batch_processing_units
+from shcli.process.process import process_request
+from shcli.process.query_builder import create_request_data
+from shcli.sync.sync_model import AOIModel, SyncOptions
+from shcli.utils.file_utils import FILE_EXTENSIONS, cog_writer, save_image_to_file
+
+
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PAGE_LIMIT = 100
+
+
+def load_aois(file_path: str) -> List[AOIModel]:
+    """
+    Reads the list of areas of interest to sync.
+
+    Args:
+        file_path (str): Path to a JSON file holding a list of {"name": ..., "bbox": [...]} objects.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"{file_path} not found.")
+
+    with open(file_path, "r") as file:
+        aois = [AOIModel(**aoi) for aoi in json.load(file)]
+
+    names = [aoi.name for aoi in aois]
+    if len(names) != len(set(names)):
+        raise ValueError("AOI names must be unique, they name the state and output files.")
+
+    return aois
+
+
+def read_sync_state(state_dir: str, name: str) -> Optional[str]:
+    """
+    Returns the datetime of the last processed acquisition for an AOI, if any.
+    """
+    state_file = os.path.join(state_dir, f"{name}.json")
+    if not os.path.exists(state_file):
+        return None
+
+    with open(state_file, "r") as file:
+        return json.load(file).get("last_acquisition")
+
+
+def write_sync_state(state_dir: str, name: str, last_acquisition: str) -> None:
+    """
+    Records the datetime of the last processed acquisition for an AOI.
+
+    The state is written to a temporary file first so an interrupted run never
+    leaves a truncated state file behind.
+    """
+    os.makedirs(state_dir, exist_ok=True)
+    state_file = os.path.join(state_dir, f"{name}.json")
+
+    with open(f"{state_file}.tmp", "w") as file:
+        json.dump({"name": name, "last_acquisition": last_acquisition}, file)
+    os.replace(f"{state_file}.tmp", state_file)
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def find_new_acquisitions(
+    token: str,
+    bbox: List[float],
+    options: SyncOptions,
+    since: Optional[str] = None,
+    scheduler: Optional[BudgetScheduler] = None
+) -> List[Tuple[str, str]]:
+    """
+    Finds the acquisition dates newer than the last processed acquisition.
+
+    Args:
+        token (str): Bearer token for authentication.
+        bbox (list): Bounding box coordinates [minLon, minLat, maxLon, maxLat].
+        options (SyncOptions): Sync options holding the date window, collection and cloud cover.
+        since (str): Datetime of the last processed acquisition, None on the first run.
+        scheduler (BudgetScheduler): Optional scheduler, each catalog page counts against its request budget.
+
+    Returns:
+        List[Tuple[str, str]]: Sorted (date, latest acquisition datetime) pairs, one per day.
+    """
+    start = since or f"{options.start_date}T00:00:00Z"
+    window = f"{start}/{options.end_date}T23:59:59Z"
+    since_datetime = _parse_datetime(since) if since else None
+
+    acquisitions: Dict[str, str] = {}
+    next_token = None
+
+    while True:
+        if scheduler is not None and scheduler.request_bucket is not None:
+            scheduler.request_bucket.acquire(1.0)
+
+        response = catalog_request(
+            token=token,
+            collections=[options.satellite_type],
+            datetime=window,
+            bbox=bbox,
+            limit=CATALOG_PAGE_LIMIT,
+            cloud_cover=options.max_cloud_coverage,
+            next_token=next_token,
+            raise_on_error=True
+        )
+
+        for feature in response.get("features", []):
+            acquired = feature.get("properties", {}).get("datetime")
+            if not acquired:
+                continue
+            if since_datetime is not None and _parse_datetime(acquired) <= since_datetime:
+                continue
+
+            date = acquired[:10]
+            if date not in acquisitions or _parse_datetime(acquired) > _parse_datetime(acquisitions[date]):
+                acquisitions[date] = acquired
+
+        next_token = response.get("context", {}).get("next")
+        if next_token is None:
+            break
+
+    return sorted(acquisitions.items())
+
+
+def sync_aoi(
+    token: str,
+    aoi: AOIModel,
+    options: SyncOptions,
+    scheduler: Optional[BudgetScheduler] = None
+) -> Dict[str, Any]:
+    """
+    Fetches the acquisitions of one AOI that are newer than its recorded state.
+
+    Acquisitions are fetched oldest first and the state is advanced after each
+    successful request, so an interrupted run resumes where it stopped.
+
+    Returns:
+        Dict[str, Any]: A summary of the AOI run.
+    """
+    since = read_sync_state(options.state_dir, aoi.name)
+    acquisitions = find_new_acquisitions(token, aoi.bbox, options, since, scheduler)
+
+    payloads = [
+        (date, acquired, create_request_data(
+            bbox=aoi.bbox,
+            start_date=date,
+            end_date=date,
+            maxCloudCoverage=options.max_cloud_coverage,
+            mosaickingOrder="leastCC",
+            satellite_type=options.satellite_type,
+            eval_type=options.output_type,
+            output_format=options.output_format,
+            resolution=options.resolution,
+            max_pixels=options.max_pixels
+        ))
+        for date, acquired in acquisitions
+    ]
+
+    summary = {
+        "name": aoi.name,
+        "last_acquisition": since,
+        "new_acquisitions": len(payloads),
+        "estimated_processing_units": round(estimate_batch_processing_units(data for _, _, data in payloads), 2),
+        "fetched": 0
+    }
+
+    if options.dry_run or not payloads:
+        return summary
+
+    if options.output_format.upper() == "COG":
+        writer = cog_writer(aoi.bbox, options.compression)
+    else:
+        writer = save_image_to_file
+
+    os.makedirs(options.output_dir, exist_ok=True)
+    file_extension = FILE_EXTENSIONS.get(options.output_format.upper(), ".png")
+
+    for date, acquired, data in payloads:
+        output_file = os.path.join(options.output_dir, f"{aoi.name}_{date}{file_extension}")
+
+        if not process_request(token=token, data=data, output_file=output_file, scheduler=scheduler, writer=writer):
+            logger.error(f"Stopping sync of {aoi.name} at {date}, it will be retried on the next run.")
+            break
+
+        write_sync_state(options.state_dir, aoi.name, acquired)
+        summary["last_acquisition"] = acquired
+        summary["fetched"] += 1
+
+    return summary
+
+
+def sync_aois(
+    token: str,
+    aois: List[AOIModel],
+    options: SyncOptions,
+    workers: int = 1,
+    scheduler: Optional[BudgetScheduler] = None
+) -> List[Dict[str, Any]]:
+    """
+    Syncs several AOIs, in parallel when workers is greater than 1.
+
+    A failing AOI is reported in its summary and does not stop the others.
+    """
+    def run(aoi: AOIModel) -> Dict[str, Any]:
+        try:
+            return sync_aoi(token, aoi, options, scheduler)
+        except Exception as e:
+            logger.error(f"Error syncing {aoi.name}: {e}")
+            return {"name": aoi.name, "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(executor.map(run, aois))
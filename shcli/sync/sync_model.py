@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from shcli.process.query_builder import MAX_OUTPUT_PIXELS
+from shcli.utils.utils import validate_bbox
+
+class AOIModel(BaseModel):
+    """ A model to validate an area of interest from the sync AOI file"""
+    name: str = Field(pattern=r"^[A-Za-z0-9_.-]+$")
+    bbox: List[float]
+
+    @field_validator("bbox")
+    @classmethod
+    def check_bbox(cls, bbox: List[float]) -> List[float]:
+        if not validate_bbox(bbox):
+            raise ValueError("Invalid bounding box, expected [minLon, minLat, maxLon, maxLat].")
+        return bbox
+
+
+class SyncOptions(BaseModel):
+    """ Options shared by every AOI of a sync run"""
+    start_date: str
+    end_date: str
+    satellite_type: str = "sentinel-2-l2a"
+    output_type: str = "NDVI"
+    output_format: str = "PNG"
+    output_dir: str = "shcli_sync"
+    state_dir: str = ".shcli_state"
+    max_cloud_coverage: int = 20
+    resolution: Optional[float] = None
+    max_pixels: int = MAX_OUTPUT_PIXELS
+    compression: str = "DEFLATE"
+    dry_run: bool = False
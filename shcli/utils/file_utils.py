@@ -1,20 +1,140 @@
+import os
+import tempfile
+import warnings
+from typing import Callable, List
 import logging
 
 logger = logging.getLogger(__name__)
 
-def save_image_to_file(content: bytes, output_file: str) -> None:
+FILE_EXTENSIONS = {"PNG": ".png", "TIFF": ".tiff", "COG": ".tif"}
+COG_COMPRESSIONS = ["DEFLATE", "ZSTD"]
+COG_BLOCKSIZE = 512
+
+
+def save_image_to_file(content: bytes, output_file: str) -> bool:
     """
     Saves binary content to a file.
     
     Args:
         content (bytes): The binary content to save.
         output_file (str): The path of the output file.
+
+    Returns:
+        bool: True if the file was written.
     """
     try:
         with open(output_file, "wb") as file:
             file.write(content)
 
         logger.info(f"Image successfully saved to {output_file}")
+        return True
 
     except IOError as e:
         logger.error(f"Error saving the image to {output_file}: {e}")
+        return False
+
+
+def _import_rasterio():
+    """
+    Imports rasterio, which is only needed for Cloud-Optimized GeoTIFF output.
+    """
+    try:
+        import rasterio
+        import rasterio.shutil
+    except ImportError as e:
+        raise ImportError("COG output requires rasterio. Install it with: pip install 'shcli[cog]'") from e
+
+    return rasterio
+
+
+def save_cog_to_file(
+    content: bytes,
+    output_file: str,
+    bbox: List[float],
+    compression: str = "DEFLATE",
+    blocksize: int = COG_BLOCKSIZE
+) -> bool:
+    """
+    Saves image content as a tiled, compressed Cloud-Optimized GeoTIFF with overviews.
+
+    The image is georeferenced to the bounding box in EPSG:4326. The response
+    is already buffered in memory; only the output is written tile by tile.
+
+    Args:
+        content (bytes): The image returned by the Process API (PNG or TIFF).
+        output_file (str): The path of the output file.
+        bbox (list): Bounding box coordinates [minLon, minLat, maxLon, maxLat].
+        compression (str): Internal compression, DEFLATE or ZSTD (default: DEFLATE).
+        blocksize (int): Tile width and height in pixels (default: 512).
+
+    Returns:
+        bool: True if the file was written.
+    """
+    rasterio = _import_rasterio()
+    from rasterio.errors import NotGeoreferencedWarning
+    from rasterio.io import MemoryFile
+    from rasterio.transform import from_bounds
+
+    if compression.upper() not in COG_COMPRESSIONS:
+        raise ValueError(f"Unsupported compression {compression}. Choose one of {COG_COMPRESSIONS}.")
+
+    try:
+        with warnings.catch_warnings(), MemoryFile(content) as memfile, tempfile.TemporaryDirectory() as tmp_dir:
+            # PNG responses carry no georeferencing, it is taken from the bbox below.
+            warnings.simplefilter("ignore", NotGeoreferencedWarning)
+            with memfile.open() as src:
+                profile = {
+                    "driver": "GTiff",
+                    "width": src.width,
+                    "height": src.height,
+                    "count": src.count,
+                    "dtype": src.dtypes[0],
+                    "crs": "EPSG:4326",
+                    "transform": from_bounds(*bbox, src.width, src.height),
+                    "tiled": True,
+                    "blockxsize": blocksize,
+                    "blockysize": blocksize,
+                    "compress": compression.upper()
+                }
+                georeferenced_file = os.path.join(tmp_dir, "georeferenced.tif")
+
+                with rasterio.open(georeferenced_file, "w", **profile) as dst:
+                    for _, window in dst.block_windows(1):
+                        dst.write(src.read(window=window), window=window)
+
+                rasterio.shutil.copy(
+                    georeferenced_file,
+                    output_file,
+                    driver="COG",
+                    compress=compression.upper(),
+                    predictor="YES",
+                    blocksize=blocksize,
+                    overviews="AUTO",
+                    overview_resampling="AVERAGE"
+                )
+
+        logger.info(f"Cloud-Optimized GeoTIFF successfully saved to {output_file}")
+        return True
+
+    except (IOError, rasterio.errors.RasterioError) as e:
+        logger.error(f"Error saving the Cloud-Optimized GeoTIFF to {output_file}: {e}")
+        return False
+
+
+def cog_writer(
+    bbox: List[float],
+    compression: str = "DEFLATE",
+    blocksize: int = COG_BLOCKSIZE
+) -> Callable[[bytes, str], bool]:
+    """
+    Returns a writer saving image content as a Cloud-Optimized GeoTIFF.
+
+    rasterio is imported up front so a missing dependency is reported before
+    any processing units are spent.
+    """
+    _import_rasterio()
+
+    def writer(content: bytes, output_file: str) -> bool:
+        return save_cog_to_file(content, output_file, bbox, compression=compression, blocksize=blocksize)
+
+    return writer
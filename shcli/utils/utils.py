@@ -1,6 +1,7 @@
+import math
 import os
 from shapely.geometry import box
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import json
 import logging
@@ -37,6 +38,31 @@ def validate_bbox(bbox: Optional[List[float]]) -> bool:
     return False
 
 
+EARTH_RADIUS_METERS = 6371008.8
+
+
+def bbox_size_meters(bbox: List[float]) -> Tuple[float, float]:
+    """
+    Approximates the ground extent of a WGS84 bounding box in meters.
+
+    The width is measured along the central latitude of the box and the
+    height along a meridian, using a spherical earth.
+
+    Args:
+        bbox: Bounding box coordinates [minLon, minLat, maxLon, maxLat].
+
+    Returns:
+        Tuple[float, float]: The (width, height) of the box in meters.
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    mid_lat = math.radians((min_lat + max_lat) / 2)
+
+    width = EARTH_RADIUS_METERS * math.radians(max_lon - min_lon) * math.cos(mid_lat)
+    height = EARTH_RADIUS_METERS * math.radians(max_lat - min_lat)
+
+    return width, height
+
+
 def save_login_credentials(
                         client_id: str, 
                         client_secret: str, 
@@ -0,0 +1,79 @@
+import pytest
+
+from shcli.process.budget import BudgetScheduler, TokenBucket, estimate_batch_processing_units, estimate_processing_units
+from shcli.process.query_builder import create_request_data
+
+
+class FakeClock:
+    """ A manually advanced clock for pacing tests """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_estimate_processing_units():
+    """
+    Test processing unit estimation from pixels, bands and dates.
+    """
+    bbox = [12.0, 47.0, 13.0, 48.0]
+    visual = create_request_data(bbox, "2022-01-01", "2022-12-31", 20, "leastCC", "sentinel-2-l2a", "VISUAL", width=1024, height=512)
+    ndvi = create_request_data(bbox, "2022-01-01", "2022-12-31", 20, "leastCC", "sentinel-2-l2a", "NDVI", width=1024, height=512)
+
+    assert estimate_processing_units(visual) == pytest.approx(2.0)
+    assert estimate_processing_units(ndvi) == pytest.approx(2.0 * 2 / 3)
+    assert estimate_processing_units(visual, num_dates=3) == pytest.approx(6.0)
+    assert estimate_batch_processing_units([visual, ndvi]) == pytest.approx(2.0 + 4 / 3)
+
+def test_estimate_processing_units_minimum_and_float():
+    """
+    Test the minimum area charge and the FLOAT32 multiplier.
+    """
+    data = {
+        "output": {"width": 10, "height": 10},
+        "evalscript": 'input: ["B02", "B03", "B04"], output: {bands: 3, sampleType: "FLOAT32"}'
+    }
+    assert estimate_processing_units(data) == pytest.approx(0.02)
+    assert estimate_processing_units({}) == 0.0
+
+def test_token_bucket_waits_for_refill():
+    """
+    Test the token bucket paces acquisitions to the configured rate.
+    """
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_minute=60, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert clock.now == pytest.approx(1.0)
+
+def test_budget_scheduler_paces_processing_units():
+    """
+    Test the scheduler waits when the processing unit budget is spent.
+    """
+    clock = FakeClock()
+    scheduler = BudgetScheduler(pu_per_minute=10, requests_per_minute=100, clock=clock, sleep=clock.sleep)
+
+    scheduler.acquire(10)
+    scheduler.acquire(5)
+    assert clock.now == pytest.approx(30.0)
+
+def test_budget_scheduler_oversized_requests_keep_rate():
+    """
+    Test requests costing more than the budget per minute still keep the long-run rate.
+    """
+    clock = FakeClock()
+    scheduler = BudgetScheduler(pu_per_minute=5, clock=clock, sleep=clock.sleep)
+
+    for _ in range(6):
+        scheduler.acquire(10.35)
+
+    assert clock.now == pytest.approx(5 * 10.35 / 5 * 60)
+    # Everything but the last request has been paid back at 5 PU per minute.
+    assert 5 * 10.35 / (clock.now / 60) <= 5 + 1e-9
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from shcli.utils.file_utils import save_cog_to_file, save_image_to_file
+
+rasterio = pytest.importorskip("rasterio")
+from rasterio.io import MemoryFile
+
+
+@pytest.fixture(scope="function")
+def png_content():
+    """
+    Create an in-memory RGB PNG like the ones returned by the Process API.
+    """
+    data = np.random.default_rng(0).integers(0, 255, size=(3, 1100, 1300), dtype=np.uint8)
+    with MemoryFile() as memfile:
+        with memfile.open(driver="PNG", width=1300, height=1100, count=3, dtype="uint8") as dst:
+            dst.write(data)
+        return memfile.read(), data
+
+def test_save_image_to_file(tmp_path):
+    """
+    Test saving raw image bytes.
+    """
+    output_file = tmp_path / "image.png"
+    save_image_to_file(b"content", str(output_file))
+    assert output_file.read_bytes() == b"content"
+
+@pytest.mark.parametrize("compression", ["DEFLATE", "ZSTD"])
+def test_save_cog_to_file(tmp_path, png_content, compression):
+    """
+    Test writing a georeferenced, tiled and compressed COG with overviews.
+    """
+    content, data = png_content
+    bbox = [12.0, 47.0, 13.0, 48.0]
+    output_file = tmp_path / "image.tif"
+
+    save_cog_to_file(content, str(output_file), bbox, compression=compression)
+
+    with rasterio.open(output_file) as src:
+        assert src.crs.to_epsg() == 4326
+        assert src.bounds == pytest.approx(bbox)
+        assert src.block_shapes[0] == (512, 512)
+        assert src.compression.name.upper() == compression
+        assert src.overviews(1)
+        assert (src.read() == data).all()
+
+def test_save_cog_to_file_invalid_compression(tmp_path, png_content):
+    """
+    Test unsupported compressions are rejected.
+    """
+    with pytest.raises(ValueError):
+        save_cog_to_file(png_content[0], str(tmp_path / "image.tif"), [12.0, 47.0, 13.0, 48.0], compression="JPEG")
@@ -1,5 +1,5 @@
 import pytest
-from shcli.process.query_builder import create_request_data
+from shcli.process.query_builder import compute_output_size, create_request_data
 
 def test_create_request_data():
     """
@@ -10,3 +10,39 @@ def test_create_request_data():
     assert "input" in data
     assert "output" in data
     assert data["input"]["data"][0]["dataFilter"]["maxCloudCoverage"] == 20
+
+def test_create_request_data_with_resolution():
+    """
+    Test output size derived from a target resolution.
+    """
+    bbox = [12.845434, 47.753636, 13.099575, 47.882276]
+    data = create_request_data(bbox, "2022-01-01", "2022-12-31", 20, "leastCC", "sentinel-2-l2a", "NDVI", resolution=10)
+    width, height = data["output"]["width"], data["output"]["height"]
+    assert isinstance(width, int) and isinstance(height, int)
+    assert 1850 < width < 1950
+    assert 1400 < height < 1450
+
+def test_compute_output_size_capped():
+    """
+    Test output size is capped by max_pixels keeping the aspect ratio.
+    """
+    bbox = [12.0, 47.0, 14.0, 48.0]
+    width, height = compute_output_size(bbox, resolution=10, max_pixels=1000)
+    assert width == 1000
+    assert 700 < height < 800
+
+def test_compute_output_size_invalid_resolution():
+    """
+    Test non-positive resolution is rejected.
+    """
+    with pytest.raises(ValueError):
+        compute_output_size([12.0, 47.0, 13.0, 48.0], resolution=0)
+
+def test_create_request_data_max_pixels_without_resolution():
+    """
+    Test max_pixels also caps the default output size.
+    """
+    bbox = [12.0, 47.0, 13.0, 48.0]
+    data = create_request_data(bbox, "2022-01-01", "2022-12-31", 20, "leastCC", "sentinel-2-l2a", "NDVI", max_pixels=100)
+    assert data["output"]["width"] == 100
+    assert data["output"]["height"] == 75
@@ -0,0 +1,147 @@
+import json
+import pytest
+import requests
+from unittest.mock import patch
+
+from shcli.process.budget import BudgetScheduler
+from shcli.sync.sync import find_new_acquisitions, load_aois, read_sync_state, sync_aoi, sync_aois, write_sync_state
+from shcli.sync.sync_model import AOIModel, SyncOptions
+
+def feature(acquired: str) -> dict:
+    return {"id": acquired, "properties": {"datetime": acquired}}
+
+@pytest.fixture(scope="function")
+def options(tmp_path):
+    """
+    Create sync options writing into a temporary directory.
+    """
+    return SyncOptions(
+        start_date="2024-10-01",
+        end_date="2024-10-31",
+        output_dir=str(tmp_path / "output"),
+        state_dir=str(tmp_path / "state")
+    )
+
+def test_load_aois(tmp_path):
+    """
+    Test loading and validating the AOI file.
+    """
+    aoi_file = tmp_path / "aois.json"
+    aoi_file.write_text(json.dumps([{"name": "salzburg", "bbox": [12.0, 47.0, 13.0, 48.0]}]))
+    assert load_aois(str(aoi_file))[0].name == "salzburg"
+
+    aoi_file.write_text(json.dumps([{"name": "salzburg", "bbox": [13.0, 48.0, 12.0, 47.0]}]))
+    with pytest.raises(ValueError):
+        load_aois(str(aoi_file))
+
+def test_sync_state_roundtrip(tmp_path):
+    """
+    Test reading and writing the per-AOI state file.
+    """
+    assert read_sync_state(str(tmp_path), "salzburg") is None
+    write_sync_state(str(tmp_path), "salzburg", "2024-10-05T10:00:00Z")
+    assert read_sync_state(str(tmp_path), "salzburg") == "2024-10-05T10:00:00Z"
+
+@patch("shcli.sync.sync.catalog_request")
+def test_find_new_acquisitions(mock_catalog, options):
+    """
+    Test only acquisitions after the recorded state are returned, one per day, across pages.
+    """
+    mock_catalog.side_effect = [
+        {"features": [feature("2024-10-05T10:00:00Z"), feature("2024-10-07T10:00:00Z")], "context": {"next": 2}},
+        {"features": [feature("2024-10-07T10:00:05.024Z"), feature("2024-10-10T10:00:00Z")], "context": {}}
+    ]
+
+    acquisitions = find_new_acquisitions("token", [12.0, 47.0, 13.0, 48.0], options, since="2024-10-05T10:00:00Z")
+
+    assert acquisitions == [("2024-10-07", "2024-10-07T10:00:05.024Z"), ("2024-10-10", "2024-10-10T10:00:00Z")]
+    assert mock_catalog.call_args_list[0].kwargs["datetime"] == "2024-10-05T10:00:00Z/2024-10-31T23:59:59Z"
+    assert mock_catalog.call_args_list[1].kwargs["next_token"] == 2
+
+@patch("shcli.sync.sync.process_request")
+@patch("shcli.sync.sync.catalog_request")
+def test_sync_aoi_incremental(mock_catalog, mock_process, options):
+    """
+    Test a second run only fetches acquisitions newer than the first.
+    """
+    aoi = AOIModel(name="salzburg", bbox=[12.0, 47.0, 13.0, 48.0])
+    mock_process.return_value = True
+
+    mock_catalog.return_value = {"features": [feature("2024-10-05T10:00:00Z")]}
+    first = sync_aoi("token", aoi, options)
+    assert first["fetched"] == 1
+
+    mock_catalog.return_value = {"features": [feature("2024-10-05T10:00:00Z"), feature("2024-10-08T10:00:00Z")]}
+    second = sync_aoi("token", aoi, options)
+
+    assert second["fetched"] == 1
+    assert second["last_acquisition"] == "2024-10-08T10:00:00Z"
+    assert mock_process.call_args.kwargs["output_file"].endswith("salzburg_2024-10-08.png")
+    assert read_sync_state(options.state_dir, "salzburg") == "2024-10-08T10:00:00Z"
+
+@patch("shcli.sync.sync.process_request")
+@patch("shcli.sync.sync.catalog_request")
+def test_sync_aoi_dry_run(mock_catalog, mock_process, options):
+    """
+    Test a dry run estimates cost without fetching or recording state.
+    """
+    aoi = AOIModel(name="salzburg", bbox=[12.0, 47.0, 13.0, 48.0])
+    options.dry_run = True
+    mock_catalog.return_value = {"features": [feature("2024-10-05T10:00:00Z"), feature("2024-10-08T10:00:00Z")]}
+
+    summary = sync_aoi("token", aoi, options)
+
+    assert summary["new_acquisitions"] == 2
+    assert summary["estimated_processing_units"] > 0
+    mock_process.assert_not_called()
+    assert read_sync_state(options.state_dir, "salzburg") is None
+
+@patch("shcli.sync.sync.process_request")
+@patch("requests.post")
+def test_sync_aois_catalog_page_failure(mock_post, mock_process, options):
+    """
+    Test a failing later catalog page fails the AOI and leaves its state unchanged.
+    """
+    aoi = AOIModel(name="salzburg", bbox=[12.0, 47.0, 13.0, 48.0])
+    write_sync_state(options.state_dir, "salzburg", "2024-10-01T10:00:00Z")
+
+    first_page = mock_post.return_value
+    first_page.json.return_value = {"features": [feature("2024-10-05T10:00:00Z")], "context": {"next": 2}}
+    mock_post.side_effect = [first_page, requests.ConnectionError("connection reset")]
+
+    summaries = sync_aois("token", [aoi], options)
+
+    assert "connection reset" in summaries[0]["error"]
+    mock_process.assert_not_called()
+    assert read_sync_state(options.state_dir, "salzburg") == "2024-10-01T10:00:00Z"
+
+@patch("requests.post")
+@patch("shcli.sync.sync.catalog_request")
+def test_sync_aoi_write_failure_keeps_state(mock_catalog, mock_post, options):
+    """
+    Test the state does not advance when saving the image fails.
+    """
+    aoi = AOIModel(name="salzburg", bbox=[12.0, 47.0, 13.0, 48.0])
+    mock_catalog.return_value = {"features": [feature("2024-10-20T10:00:00Z")]}
+    mock_post.return_value.content = b"image"
+
+    with patch("builtins.open", side_effect=OSError("disk full")):
+        summary = sync_aoi("token", aoi, options)
+
+    assert summary["fetched"] == 0
+    assert read_sync_state(options.state_dir, "salzburg") is None
+
+@patch("shcli.sync.sync.catalog_request")
+def test_find_new_acquisitions_uses_request_budget(mock_catalog, options):
+    """
+    Test each catalog page counts against the scheduler request budget.
+    """
+    mock_catalog.side_effect = [
+        {"features": [], "context": {"next": 2}},
+        {"features": [], "context": {}}
+    ]
+    scheduler = BudgetScheduler(requests_per_minute=10)
+
+    find_new_acquisitions("token", [12.0, 47.0, 13.0, 48.0], options, scheduler=scheduler)
+
+    assert scheduler.request_bucket.tokens == pytest.approx(8, abs=0.1)
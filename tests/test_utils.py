@@ -1,7 +1,7 @@
 import os
 import json
 import pytest
-from shcli.utils.utils import read_login_credentials, save_login_credentials, validate_bbox
+from shcli.utils.utils import bbox_size_meters, read_login_credentials, save_login_credentials, validate_bbox
 
 @pytest.fixture(scope="function")
 def temp_credentials_file(tmp_path):
@@ -56,3 +56,11 @@ def test_read_login_credentials_file_not_found():
     """
     with pytest.raises(FileNotFoundError):
         read_login_credentials("non_existent_file.json")
+
+def test_bbox_size_meters():
+    """
+    Test ground extent approximation of a bounding box.
+    """
+    width, height = bbox_size_meters([0.0, 0.0, 1.0, 1.0])
+    assert 111000 < width < 111400
+    assert 111000 < height < 111400